@@ -165,7 +165,10 @@ class Common(DefaultClass):
         super().__init__(args)
 
     def to_string(self) -> str:
-        return super().to_string({'line_height': 'lineHeight', 'scale_w': 'scaleW', 'scale_h': 'scaleH', 'pages_num': 'pages'})
+        return super().to_string({
+            'line_height': 'lineHeight', 'scale_w': 'scaleW', 'scale_h': 'scaleH', 'pages_num': 'pages',
+            'alpha_channel': 'alphaChnl', 'red_channel': 'redChnl', 'green_channel': 'greenChnl', 'blue_channel': 'blueChnl'
+        })
 
 
 class Page(DefaultClass):
@@ -290,14 +293,18 @@ class FNT(DefaultClass):
     """This variable represents characters in the font."""
     kernings: list[Kerning] = []
     """This variable represents kernings in the font."""
+    _buffer: Optional[bytes] = None
+    """The whole file as it was read (lossless mode only)."""
+    _records: tuple[DefaultClass, ...] = ()
+    """The records as they were parsed (lossless mode only)."""
+    _headers: dict[str, tuple[str, int]] = {}
+    """The original `chars`/`kernings` lines and the number of records parsed after them (lossless mode only)."""
+    _unknown: dict[str, list[str]] = {}
+    """Lines that are not known records, by the section they were found after (lossless mode only)."""
 
     def __init__(
         self
     ) -> None:
-        """
-        :param fp: An opened readable bytes file.
-        """
-
         self.info = Info()
         self.common = Common()
         self.pages = []
@@ -305,97 +312,246 @@ class FNT(DefaultClass):
         self.kernings = []
         
     @classmethod
-    def from_fp(cls, fp: IO[bytes]):
-        obj = cls.__new__(cls)
-        super(FNT, obj).__init__()
-        
-        obj.setup(fp)
+    def from_fp(cls, fp: IO[bytes], lossless: bool = False):
+        obj = cls()
+        obj.setup(fp, lossless)
         
         return obj
 
     def setup(
         self,
-        fp: IO[bytes]
+        fp: IO[bytes],
+        lossless: bool = False
     ) -> None:
+        """
+        :param fp: An opened readable bytes file.
+        :param lossless: Whether to keep the original lines and unknown keys, so they are written back unchanged.
+        """
+
         if not fp:
             return
 
-        for line in [x.decode().strip() for x in fp.read().splitlines()]:
-            if line == "":
-                continue
+        data = fp.read()
 
-            if line.startswith("info"):
-                groups = get_pairs(line)
+        # A count can't be larger than the number of lines, so a broken header can't make us allocate too much
+        max_count = data.count(b'\n') + 1
 
-                groups = replace_dict_key(groups, "stretchH", "stretch_h")
+        chars_num = len(self.chars)
+        kernings_num = len(self.kernings)
 
-                self.info = Info(groups)
+        headers = {}
+        unknown = {}
+        section = ''
 
-            elif line.startswith("common"):
-                groups = get_pairs(line)
+        for source in data.splitlines():
+            source = source.decode()
+            line = source.strip()
+
+            if line == "":
+                if lossless:
+                    unknown.setdefault(section, []).append(source)
 
-                groups = replace_dict_key(groups, 'lineHeight', 'line_height')
-                groups = replace_dict_key(groups, 'scaleW', 'scale_w')
-                groups = replace_dict_key(groups, 'scaleH', 'scale_h')
-                groups = replace_dict_key(groups, 'pages', 'pages_num')
+                continue
 
-                self.common = Common(groups)
+            if line.startswith("info"):
+                section = 'info'
+                self.info = self._parse(Info, line, source, lossless, {'stretchH': 'stretch_h'})
+
+            elif line.startswith("common"):
+                section = 'common'
+                self.common = self._parse(Common, line, source, lossless, {
+                    'lineHeight': 'line_height', 'scaleW': 'scale_w', 'scaleH': 'scale_h', 'pages': 'pages_num',
+                    'alphaChnl': 'alpha_channel', 'redChnl': 'red_channel', 'greenChnl': 'green_channel', 'blueChnl': 'blue_channel'
+                })
 
             elif line.startswith("page"):
-                groups = get_pairs(line)
+                section = 'pages'
+                self.pages.append(self._parse(Page, line, source, lossless, {'file': 'tex_name'}))
 
-                groups = replace_dict_key(groups, 'file', 'tex_name')
+            elif line.startswith("chars "):
+                section = 'chars'
+                headers['chars'] = source
 
-                self.pages.append(Page(groups))
+                # Pre-size the list with the declared count, it is trimmed below if the file lied
+                self.chars.extend([None] * min(self._get_count(line), max_count))
 
             elif line.startswith("char "):
-                groups = get_pairs(line)
+                section = 'chars'
+                char = self._parse(Char, line, source, lossless)
+
+                if chars_num < len(self.chars):
+                    self.chars[chars_num] = char
+                else:
+                    self.chars.append(char)
+
+                chars_num += 1
 
-                self.chars.append(Char(groups))
+            elif line.startswith("kernings "):
+                section = 'kernings'
+                headers['kernings'] = source
+
+                self.kernings.extend([None] * min(self._get_count(line), max_count))
 
             elif line.startswith("kerning "):
-                groups = get_pairs(line)
+                section = 'kernings'
+                kerning = self._parse(Kerning, line, source, lossless, {'first': 'first_id', 'second': 'second_id'})
+
+                if kernings_num < len(self.kernings):
+                    self.kernings[kernings_num] = kerning
+                else:
+                    self.kernings.append(kerning)
+
+                kernings_num += 1
+
+            elif lossless:
+                unknown.setdefault(section, []).append(source)
+
+        del self.chars[chars_num:]
+        del self.kernings[kernings_num:]
+
+        if lossless:
+            object.__setattr__(self, '_buffer', data)
+            object.__setattr__(self, '_records', self._get_records())
+            object.__setattr__(self, '_headers', {
+                name: (source, len(getattr(self, name))) for name, source in headers.items()
+            })
+            object.__setattr__(self, '_unknown', unknown)
+            object.__setattr__(self, '_dirty', False)
+
+    @staticmethod
+    def _parse(
+        record_type: type[DefaultClass],
+        line: str,
+        source: str,
+        lossless: bool,
+        replacements: Optional[dict[str, str]] = None
+    ) -> DefaultClass:
+        """Create an object of type `record_type` from a line, renaming the keys with `replacements`."""
 
-                groups = replace_dict_key(groups, 'first', 'first_id')
-                groups = replace_dict_key(groups, 'second', 'second_id')
+        if not replacements:
+            replacements = {}
 
-                self.kernings.append(Kerning(groups))
+        groups = get_pairs(line)
+
+        for old_key, new_key in replacements.items():
+            groups = replace_dict_key(groups, old_key, new_key)
+
+        obj = record_type(groups)
+
+        if lossless:
+            obj._set_source(source, {
+                name: value for name, value in get_raw_pairs(line).items()
+                if not hasattr(obj, replacements.get(name, name))
+            })
+
+        return obj
+
+    @staticmethod
+    def _get_count(line: str) -> int:
+        """Get the `count` of a `chars`/`kernings` line. It is only used as a hint, so a broken value is ignored."""
+
+        count = re.search(r'\bcount=(\d+)', line)
+
+        return int(count.group(1)) if count else 0
+
+    def _get_records(self) -> tuple[DefaultClass, ...]:
+        return (self.info, self.common, *self.pages, *self.chars, *self.kernings)
+
+    def _is_modified(self) -> bool:
+        """Whether the font differs from what was parsed, i.e. whether it has to be regenerated on dump."""
+
+        if self._dirty or self._buffer is None:
+            return True
+
+        records = self._get_records()
+
+        return len(records) != len(self._records) or any(
+            x is not y or x._is_modified() for x, y in zip(records, self._records)
+        )
 
     def __repr__(self) -> str:
         return f'<FNT info={"None" if not self.info else "<Info ...>"} common={"None" if not self.common else "<Common ...>"} ' \
                f'pages={"[]" if not self.pages else "[...]"} chars={"[]" if not self.chars else "[...]"} kernings={"[]" if not self.chars else "[...]"}>'
 
     def to_string(self) -> str:
-        ret = ""
+        return '\n'.join(self._get_lines()).strip()
+
+    def to_bytes(self) -> bytes:
+        """Get the .fnt representation of the font.
+        
+        An unmodified font loaded in lossless mode is returned as is. A modified one keeps the original line endings."""
+
+        if not self._is_modified():
+            return self._buffer
+
+        if self._buffer is None:
+            return self.to_string().encode()
+
+        newline = b'\r\n' if b'\r\n' in self._buffer else b'\n'
+        ret = newline.join(x.encode() for x in self._get_lines())
 
-        ret += f'info {self.info.to_string()}\ncommon {self.common.to_string()}\n'
+        return ret + newline if self._buffer.endswith((b'\n', b'\r')) else ret
+
+    def _get_lines(self) -> list[str]:
+        ret = [
+            *self._unknown.get('', []),
+            self._get_line("info", self.info),
+            *self._unknown.get('info', []),
+            self._get_line("common", self.common),
+            *self._unknown.get('common', [])
+        ]
 
         for page in self.pages:
-            ret += f'page {page.to_string()}\n'
+            ret.append(self._get_line("page", page))
+
+        ret += self._unknown.get('pages', [])
 
         if self.chars:
-            ret += f'chars count={len(self.chars)}\n'
+            ret.append(self._get_header('chars'))
 
             for char in self.chars:
-                ret += f'char {char.to_string()}\n'
+                ret.append(self._get_line("char", char))
+
+        ret += self._unknown.get('chars', [])
 
         if self.kernings:
-            ret += f'kernings count={len(self.kernings)}\n'
+            ret.append(self._get_header('kernings'))
 
             for k in self.kernings:
-                ret += f'kerning {k.to_string()}\n'
+                ret.append(self._get_line("kerning", k))
 
-        return ret.strip()
+        ret += self._unknown.get('kernings', [])
+
+        return ret
+
+    def _get_header(self, name: str) -> str:
+        count = len(getattr(self, name))
+
+        if name in self._headers and self._headers[name][1] == count:
+            return self._headers[name][0]
+
+        return f'{name} count={count}'
+
+    @staticmethod
+    def _get_line(name: str, record: DefaultClass) -> str:
+        if record._source is not None and not record._is_modified():
+            return record._source
+
+        return f'{name} {record.to_string()}'
 
 
 def load(
-    fp: IO[bytes]
+    fp: IO[bytes],
+    lossless: bool = False
 ) -> FNT:
     """
     Load a fnt file into an object.
     
     :param fp: An opened bytes-like file.
     :type fp: IO[bytes]
+    :param lossless: Whether to keep the original lines and unknown keys, so that unchanged parts of the font are written back as they were.
+        Only attribute assignments (e.g. ``fnt.chars[0].x = 1``) are tracked, changing ``.value`` of a field in place is not.
+    :type lossless: bool
     
     :returns: An object that represents the font.
     :rtype: FNT
@@ -407,22 +563,26 @@ def load(
         raise AttributeError(
             f'Specified "{type(fp).__name__}" is not readable.')
 
-    return FNT.from_fp(fp)
+    return FNT.from_fp(fp, lossless)
 
 
 def loads(
-    value: bytes
+    value: bytes,
+    lossless: bool = False
 ) -> FNT:
     """
     Load a fnt file from bytes string into an object.
     
     :param value: A bytes string containing a fnt file.
     :type value: bytes
+    :param lossless: Whether to keep the original lines and unknown keys, so that unchanged parts of the font are written back as they were.
+        Only attribute assignments (e.g. ``fnt.chars[0].x = 1``) are tracked, changing ``.value`` of a field in place is not.
+    :type lossless: bool
     
     :returns: An object that represents the font.
     :rtype: FNT
     """
-    return load(BytesIO(value))
+    return load(BytesIO(value), lossless)
 
 
 def dump(
@@ -444,7 +604,7 @@ def dump(
         raise AttributeError(
             f'Specified "{type(fp).__name__}" is not writable.')
 
-    fp.write(value.to_string().encode())
+    fp.write(value.to_bytes())
 
 
 def dumps(
@@ -61,12 +61,21 @@ class DefaultClass():
 
     This shold NOT be used by end users."""
 
+    _source: Optional[str] = None
+    """The original line this object was parsed from (lossless mode only)."""
+    _extra: dict[str, str] = {}
+    """Unknown keys from the original line, in their raw form (lossless mode only)."""
+    _dirty: bool = False
+    """Whether any attribute was set after the object was created."""
+
     def __init__(self, args: Optional[dict[str, Any]] = None) -> None:
         if args:
             for name, value in args.items():
                 if hasattr(self, name):
                     setattr(self, name, type(getattr(self, name))(value))
 
+        object.__setattr__(self, '_dirty', False)
+
     def __setattr__(self, __name: str, __value: Any) -> None:
         if issubclass(type(__value), Value) or not issubclass(type(self.__getattribute__(__name)), Value):
             value = __value
@@ -75,6 +84,21 @@ class DefaultClass():
                 __name).enum, type=self.__getattribute__(__name).type)
 
         object.__setattr__(self, __name, value)
+        object.__setattr__(self, '_dirty', True)
+
+    def _set_source(self, line: str, extra: dict[str, str]) -> None:
+        """Remember the original line and the unknown keys, so the object can be written back unchanged."""
+
+        object.__setattr__(self, '_source', line)
+        object.__setattr__(self, '_extra', extra)
+        object.__setattr__(self, '_dirty', False)
+
+    def _is_modified(self) -> bool:
+        """Whether this object or any of its nested objects was changed after parsing."""
+
+        return self._dirty or any(
+            x._is_modified() for x in self.__dict__.values() if isinstance(x, DefaultClass)
+        )
 
     def __repr__(self) -> str:
         # I know this expression is kind of extreme but ¯\_(ツ)_/¯
@@ -86,7 +110,7 @@ class DefaultClass():
                     + str(self.__getattribute__(x))
                     + (chr(0x22) if hasattr(self.__getattribute__(x), "type") and self.__getattribute__(
                         x).type == str and self.__getattribute__(x).value != None else "")
-                    for x in dir(self) if not x.startswith("__") and not type(getattr(self, x)).__name__ == "method"
+                    for x in dir(self) if not x.startswith("_") and not type(getattr(self, x)).__name__ == "method"
                 ]
             ) + \
             '>'
@@ -102,7 +126,10 @@ class DefaultClass():
             + (chr(0x22) if hasattr(getattr(self, x), "type") and getattr(self,
                x).type == str and self.__getattribute__(x).value != None else "")
             for x in self.__dict__
-            if not x.startswith("__") and not type(getattr(self, x)).__name__ == "method" and str(getattr(self, x)) != "None"
+            if not x.startswith("_") and not type(getattr(self, x)).__name__ == "method" and str(getattr(self, x)) != "None"
+        ] + [
+            name + "=" + value for name, value in self._extra.items()
+            if name not in replacements.values() and not hasattr(self, name)
         ])
 
 
@@ -121,3 +148,8 @@ def replace_dict_key(dict: dict[str, Any], old_key: str, new_key: str) -> dict[s
 def get_pairs(line: str) -> dict[str, str]:
     """This is a main function to get values from the font file"""
     return {y[0]: y[1] for y in [x.replace("\"", "").split("=") for x in re.split(r"\s+", line)][1:]}
+
+
+def get_raw_pairs(line: str) -> dict[str, str]:
+    """Same as `get_pairs`, but keeps the values exactly as they are written (including quotes)."""
+    return {y[0]: y[1] for y in [x.split("=", 1) for x in re.split(r"\s+", line)][1:] if len(y) == 2}
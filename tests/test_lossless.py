@@ -0,0 +1,126 @@
+import fntlib
+
+
+SOURCE = (
+    b'info face="Arial" size=32 bold=0 italic=0 charset="" unicode=1 stretchH=100 smooth=1 aa=1 padding=0,0,0,0 spacing=1,1 outline=0\r\n'
+    b'common lineHeight=32 base=26 scaleW=256 scaleH=256 pages=2 packed=0 alphaChnl=1 redChnl=0 greenChnl=0 blueChnl=0\r\n'
+    b'page id=0 file="font_0.png"\r\n'
+    b'page id=1 file="font_1.png"\r\n'
+    b'chars count=3\r\n'
+    b'char id=32   x=0     y=0     width=0     height=0     xoffset=0     yoffset=0     xadvance=8     page=0  chnl=15\r\n'
+    b'char id=65   x=1     y=0     width=20    height=24    xoffset=0     yoffset=2     xadvance=21    page=0  chnl=15 letter="A"\r\n'
+    b'char id=66   x=22    y=0     width=18    height=24    xoffset=1     yoffset=2     xadvance=20    page=1  chnl=15\r\n'
+    b'kernings count=2\r\n'
+    b'kerning first=65 second=66 amount=-1\r\n'
+    b'kerning first=66 second=65 amount=-2\r\n'
+)
+
+INFO_LINE = 'info face="Arial" size=32 bold=0 italic=0 charset="" unicode=1 stretchH=100 smooth=1 aa=1 padding=0,0,0,0 spacing=1,1 outline=0'
+
+CHAR_LINE = b'char id=65   x=1     y=0     width=20    height=24    xoffset=0     yoffset=2     xadvance=21    page=0  chnl=15 letter="A"'
+
+
+def test_unmodified_round_trip_is_byte_exact():
+    assert fntlib.dumps(fntlib.loads(SOURCE, lossless=True)) == SOURCE
+
+
+def test_edited_char_keeps_other_lines_and_unknown_keys():
+    fnt = fntlib.loads(SOURCE, lossless=True)
+    fnt.chars[1].x = 5
+
+    assert fntlib.dumps(fnt) == SOURCE.replace(
+        CHAR_LINE,
+        b'char id=65 x=5 y=0 width=20 height=24 xoffset=0 yoffset=2 xadvance=21 page=0 chnl=15 letter="A"'
+    )
+
+
+def test_edited_nested_value_regenerates_line():
+    fnt = fntlib.loads(SOURCE, lossless=True)
+    fnt.info.padding.down = 9
+
+    assert fntlib.dumps(fnt) == SOURCE.replace(b'padding=0,0,0,0', b'padding=0,0,9,0')
+
+
+def test_edited_channel_does_not_duplicate_key():
+    fnt = fntlib.loads(SOURCE, lossless=True)
+    fnt.common.alpha_channel = fntlib.ChannelInfo.ONE
+
+    assert fntlib.dumps(fnt) == SOURCE.replace(
+        b'common lineHeight=32 base=26 scaleW=256 scaleH=256 pages=2 packed=0 alphaChnl=1',
+        b'common lineHeight=32 base=26 scaleW=256 scaleH=256 pages=2 packed=0 alphaChnl=4'
+    )
+
+
+def test_list_changes_are_written():
+    fnt = fntlib.loads(SOURCE, lossless=True)
+    source = SOURCE.split(b'\r\n')
+
+    fnt.chars.append(fntlib.Char({'id': '67'}))
+    fnt.chars.pop(0)
+    fnt.pages.reverse()
+    fnt.kernings.pop()
+
+    assert fntlib.dumps(fnt) == b'\r\n'.join([
+        *source[:2], source[3], source[2],
+        source[4], source[6], source[7], b'char id=67',
+        b'kernings count=1', source[9], b'',
+    ])
+
+
+def test_unknown_lines_survive_edits():
+    source = b'info face="x"\ncommon lineHeight=32\ndistanceField fieldType=msdf distanceRange=4\n\nchars count=1\nchar id=1 x=0\n'
+
+    fnt = fntlib.loads(source, lossless=True)
+    fnt.chars[0].x = 3
+
+    assert fntlib.dumps(fnt) == source.replace(b'char id=1 x=0', b'char id=1 x=3')
+
+
+def test_chars_count_larger_than_chars():
+    fnt = fntlib.loads(b'info face="x"\nchars count=10\nchar id=1\nchar id=2\nkernings count=5\nkerning first=1 second=2 amount=1')
+
+    assert [str(c.id) for c in fnt.chars] == ['1', '2']
+    assert len(fnt.kernings) == 1
+
+
+def test_chars_count_smaller_than_chars():
+    fnt = fntlib.loads(b'info face="x"\nchars count=1\nchar id=1\nchar id=2\nchar id=3')
+
+    assert [str(c.id) for c in fnt.chars] == ['1', '2', '3']
+
+
+def test_huge_count_is_capped():
+    fnt = fntlib.loads(b'info face="x"\nchars count=200000000\nchar id=1\nkernings count=200000000')
+
+    assert len(fnt.chars) == 1
+    assert fnt.kernings == []
+
+
+def test_broken_count_is_ignored():
+    assert len(fntlib.loads(b'info face="x"\nchars count=\nchar id=1').chars) == 1
+    assert len(fntlib.loads(b'info face="x"\nchars count=abc\nchar id=1').chars) == 1
+    assert len(fntlib.loads(b'info face="x"\nchars count=3 foo\nchar id=1').chars) == 1
+
+
+def test_default_mode_output_is_unchanged():
+    source = (
+        INFO_LINE.encode() + b'\n'
+        b'common lineHeight=32 base=26 scaleW=256 scaleH=256 pages=1 packed=0\n'
+        b'page id=0 file="font.png"\n'
+        b'chars count=2\n'
+        b'char id=32   x=0     y=0     width=0     height=0     xoffset=0     yoffset=0     xadvance=8     page=0  chnl=15\n'
+        b'char id=65   x=1     y=0     width=20    height=24    xoffset=0     yoffset=2     xadvance=21    page=0  chnl=15\n'
+        b'kernings count=1\n'
+        b'kerning first=65 second=32 amount=-1\n'
+    )
+
+    assert fntlib.dumps(fntlib.loads(source)) == (
+        INFO_LINE.encode() + b'\n'
+        b'common lineHeight=32 base=26 scaleW=256 scaleH=256 pages=1 packed=0\n'
+        b'page id=0 file="font.png"\n'
+        b'chars count=2\n'
+        b'char id=32 x=0 y=0 width=0 height=0 xoffset=0 yoffset=0 xadvance=8 page=0 chnl=15\n'
+        b'char id=65 x=1 y=0 width=20 height=24 xoffset=0 yoffset=2 xadvance=21 page=0 chnl=15\n'
+        b'kernings count=1\n'
+        b'kerning first=65 second=32 amount=-1'
+    )